@@ -7,9 +7,21 @@ Run: python -m wingman
 Headless: python -m wingman -p "your prompt"
 """
 
-from .app import WingmanApp, main
 from .config import APP_NAME, APP_VERSION
-from .headless import run_headless
 
 __all__ = ["WingmanApp", "main", "run_headless", "APP_NAME", "APP_VERSION"]
 __version__ = APP_VERSION
+
+# Heavy entry points (Textual, dedalus SDK) are imported on first access so that
+# importing a submodule like wingman.bulletin doesn't pull in the whole app.
+_LAZY = {"WingmanApp": ".app", "main": ".app", "run_headless": ".headless"}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
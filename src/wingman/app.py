@@ -1,6 +1,7 @@
 """Main Wingman application."""
 
 import asyncio
+import contextlib
 import re
 import time
 import webbrowser
@@ -13,7 +14,7 @@ from textual import events, on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Input, Static, Tree
+from textual.widgets import Button, Input, ListView, Static, Tree
 
 from .checkpoints import get_checkpoint_manager, set_current_session
 from .command_completion import get_hint_candidates
@@ -30,10 +31,11 @@ from .config import (
 from .context import AUTO_COMPACT_THRESHOLD
 from .export import export_session_json, export_session_markdown, import_session_from_file
 from .images import CachedImage, cache_image_immediately, create_image_message_from_cache, is_image_path
-from .memory import add_entry, clear_all, load_memory
+from .memory import add_entry, clear_all, delete_entries, load_memory
 from .sessions import delete_session, load_sessions, rename_session, save_session, save_session_working_dir
 from .tools import (
     CODING_SYSTEM_PROMPT,
+    _list_files_impl,
     add_text_segment,
     check_completed_processes,
     clear_segments,
@@ -42,8 +44,10 @@ from .tools import (
     get_pending_edit,
     get_segments,
     list_processes,
+    release_panel,
     request_background,
     set_app_instance,
+    set_edit_result,
     stop_process,
 )
 from .ui import (
@@ -99,6 +103,7 @@ class WingmanApp(App):
         self.panels: list[ChatPanel] = []
         self.active_panel_idx: int = 0
         self.last_ctrl_c: float | None = None
+        self._session_names: list[str] | None = None  # Names currently shown in the sessions tree
 
     def _init_client(self, api_key: str) -> None:
         """Initialize Dedalus client with API key."""
@@ -217,12 +222,17 @@ class WingmanApp(App):
         self.query_one("#status", Static).update(Text.from_markup(status))
 
     def _refresh_sessions(self) -> None:
+        names = sorted(load_sessions().keys())
+        # Rebuilding the tree drops expansion/cursor state and re-lays out every node; skip if nothing changed
+        if names == self._session_names:
+            return
+        self._session_names = names
         tree = self.query_one("#sessions", Tree)
-        tree.clear()
-        tree.root.expand()
-        sessions = load_sessions()
-        for name in sorted(sessions.keys()):
-            tree.root.add_leaf(name)
+        with self.batch_update():
+            tree.clear()
+            tree.root.expand()
+            for name in names:
+                tree.root.add_leaf(name)
 
     def _load_session(self, session_id: str) -> None:
         """Load a session into the active panel."""
@@ -318,17 +328,16 @@ class WingmanApp(App):
     def on_click(self, event) -> None:
         """Focus input when clicking anywhere in the main area."""
         panel = self.active_panel
-        if panel:
-            # Focus the input unless clicking on an interactive element
-            from textual.widgets import Button, Input, ListView
-
-            if not isinstance(event.widget, (Button, Input, ListView, ImageChip, ToolApproval)):
-                # If there's a pending tool approval, focus that instead
-                approvals = list(panel.query("ToolApproval"))
-                if approvals:
-                    approvals[0].focus()
-                else:
-                    panel.get_input().focus()
+        if not panel:
+            return
+        # Focus the input unless clicking on an interactive element
+        if not isinstance(event.widget, (Button, Input, ListView, ImageChip, ToolApproval)):
+            # If there's a pending tool approval, focus that instead
+            approvals = list(panel.query("ToolApproval"))
+            if approvals:
+                approvals[0].focus()
+            else:
+                panel.get_input().focus()
 
     def on_paste(self, event: events.Paste) -> None:
         """Route paste events to the active input if not already focused there."""
@@ -577,6 +586,7 @@ class WingmanApp(App):
             panel.add_message("assistant", "Please enter your API key first.")
             self.push_screen(APIKeyScreen(), self._on_api_key_entered)
             return
+        panel._worker_active = True
         try:
             # Build messages with system prompt if in coding mode
             # Convert segment-based messages to content format for the model
@@ -665,7 +675,6 @@ class WingmanApp(App):
                                             break
                                     add_text_segment(content, panel.panel_id)
                                     streaming_widget.append_text(content)
-                                    panel.get_scroll_container().scroll_end(animate=False)
                                     await asyncio.sleep(0)
                 else:
                     # Raw chunk iterator (OpenAI-style)
@@ -695,7 +704,6 @@ class WingmanApp(App):
                                         break
                                 add_text_segment(delta.content, panel.panel_id)
                                 streaming_widget.append_text(delta.content)
-                                panel.get_scroll_container().scroll_end(animate=False)
                                 await asyncio.sleep(0)
             finally:
                 panel._generating = False
@@ -713,7 +721,7 @@ class WingmanApp(App):
             segments = get_segments(panel.panel_id)
             if segments:
                 panel.messages.append({"role": "assistant", "segments": segments})
-                save_session(panel.session_id, panel.messages)
+                await asyncio.to_thread(save_session, panel.session_id, list(panel.messages))
             elif not was_cancelled:
                 self._show_info("[#e0af68]Response ended with no content[/]")
 
@@ -734,7 +742,7 @@ class WingmanApp(App):
             segments = get_segments(panel.panel_id)
             if segments:
                 panel.messages.append({"role": "assistant", "segments": segments})
-                save_session(panel.session_id, panel.messages)
+                await asyncio.to_thread(save_session, panel.session_id, list(panel.messages))
             else:
                 # Only remove user message if there was no assistant response at all
                 if panel.messages and panel.messages[-1].get("role") == "user":
@@ -757,7 +765,7 @@ class WingmanApp(App):
             segments = get_segments(panel.panel_id)
             if segments:
                 panel.messages.append({"role": "assistant", "segments": segments})
-                save_session(panel.session_id, panel.messages)
+                await asyncio.to_thread(save_session, panel.session_id, list(panel.messages))
             else:
                 # Only remove user message if there was no assistant response at all
                 if panel.messages and panel.messages[-1].get("role") == "user":
@@ -768,6 +776,11 @@ class WingmanApp(App):
             elif "cancelled" not in error_msg.lower():
                 # Don't show error for cancellations, and don't use Rich markup
                 panel.add_message("assistant", f"Error: {error_msg}")
+        finally:
+            panel._worker_active = False
+            # Panel was closed mid-generation; its state was kept until the reply was saved
+            if panel not in self.panels:
+                release_panel(panel.panel_id)
 
     def show_diff_approval(self) -> None:
         """Show diff modal for pending edit approval. Called from tool thread."""
@@ -811,7 +824,9 @@ class WingmanApp(App):
         while widget.result is None:
             if not widget.is_mounted or panel._cancel_requested:
                 return ("cancelled", "")
-            await asyncio.sleep(0.05)
+            # Wake immediately on a decision; the timeout only bounds how long cancellation takes to notice
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(widget.decided.wait(), timeout=0.2)
         result = widget.result
         try:
             widget.remove()
@@ -958,6 +973,8 @@ class WingmanApp(App):
         panel = self.active_panel
         if not panel:
             return
+        if panel._generating:
+            panel._cancel_requested = True
         idx = self.active_panel_idx
         # Update index BEFORE removing to avoid out of bounds
         new_idx = idx - 1 if idx > 0 else 0
@@ -965,6 +982,9 @@ class WingmanApp(App):
         # Now remove the panel
         panel.remove()
         self.panels.remove(panel)
+        # A running send worker still needs the collected segments; it releases the panel when done
+        if not panel._worker_active:
+            release_panel(panel.panel_id)
         # Refresh welcome art on remaining panels (may have more space now)
         self.call_after_refresh(self._refresh_welcome_art)
         # Activate the new panel
@@ -1056,8 +1076,6 @@ class WingmanApp(App):
     @work
     async def _show_diff_modal(self, path: str, old_string: str, new_string: str) -> None:
         """Display diff modal and handle approval."""
-        from .tools import set_edit_result
-
         result = await self.push_screen_wait(DiffModal(path, old_string, new_string))
         set_edit_result(result)
 
@@ -1241,7 +1259,6 @@ class WingmanApp(App):
             self._show_info("\n".join(lines))
 
     def _cmd_memory(self, arg: str) -> None:
-        from .memory import delete_entries
         from .ui.modals import MemoryModal
 
         if not arg or arg == "list":
@@ -1295,8 +1312,6 @@ Useful for: API patterns, file locations, conventions.
             return
         action, entry_id = result
         if action == "delete" and entry_id:
-            from .memory import delete_entries
-
             n = delete_entries([entry_id])
             if n:
                 self.notify(f"Deleted memory {entry_id}", timeout=2.0)
@@ -1307,8 +1322,6 @@ Useful for: API patterns, file locations, conventions.
 
                     self.push_screen(MemoryModal(memory.entries), self._on_memory_action)
         elif action == "add":
-            from .ui.modals import InputModal
-
             self.push_screen(InputModal("Add Memory", "Enter note:"), self._on_memory_add)
 
     def _on_memory_add(self, text: str | None) -> None:
@@ -1362,6 +1375,21 @@ Useful for: API patterns, file locations, conventions.
         else:
             self._show_info(f"[#f7768e]Could not import from:[/] {arg}")
 
+    # Commands with complex logic, mapped to the handler that receives the argument
+    _COMPLEX_COMMANDS = {
+        "rename": _cmd_rename,
+        "delete": _cmd_delete,
+        "mcp": _cmd_mcp,
+        "code": _cmd_code,
+        "cd": _cmd_cd,
+        "history": _cmd_history,
+        "rollback": _cmd_rollback,
+        "diff": _cmd_diff,
+        "memory": _cmd_memory,
+        "export": _cmd_export,
+        "import": _cmd_import,
+    }
+
     def _handle_command(self, cmd: str) -> None:
         parts = cmd[1:].split(maxsplit=1)
         command = parts[0].lower()
@@ -1396,33 +1424,16 @@ Useful for: API patterns, file locations, conventions.
             "feature": lambda: self._open_github_issue("feature_request.yml"),
         }
 
-        # Commands with complex logic
-        complex_commands = {
-            "rename": self._cmd_rename,
-            "delete": self._cmd_delete,
-            "mcp": self._cmd_mcp,
-            "code": self._cmd_code,
-            "cd": self._cmd_cd,
-            "history": self._cmd_history,
-            "rollback": self._cmd_rollback,
-            "diff": self._cmd_diff,
-            "memory": self._cmd_memory,
-            "export": self._cmd_export,
-            "import": self._cmd_import,
-        }
-
         if command in simple_commands:
             simple_commands[command]()
-        elif command in complex_commands:
-            complex_commands[command](arg)
+        elif handler := self._COMPLEX_COMMANDS.get(command):
+            handler(self, arg)
         else:
             self._show_info(f"Unknown command: {command}")
 
     @work(thread=False)
     async def _do_ls(self, pattern: str, working_dir: Path) -> None:
         """List files asynchronously."""
-        from .tools import _list_files_impl
-
         result = await _list_files_impl(pattern, ".", working_dir)
         self._show_info(f"[dim]{working_dir}[/]\n{result}")
 
@@ -1627,9 +1638,6 @@ def main():
 
     # Headless mode
     if args.prompt:
-        import asyncio
-        from pathlib import Path
-
         from .headless import run_headless
 
         working_dir = Path(args.working_dir) if args.working_dir else None
@@ -48,7 +48,7 @@ def is_dev_mode() -> bool:
     return _get_bulletin_dir() is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class Conditions:
     """When to show a bulletin."""
 
@@ -60,7 +60,7 @@ class Conditions:
     platforms: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Optional action button."""
 
@@ -69,7 +69,7 @@ class Action:
     command: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Bulletin:
     """A single message."""
 
@@ -135,12 +135,13 @@ def _compare_versions(v1: str, v2: str) -> int:
     return 0
 
 
-def evaluate_conditions(conditions: Conditions | None) -> bool:
-    """Check if conditions are met."""
+def evaluate_conditions(conditions: Conditions | None, now: datetime | None = None) -> bool:
+    """Check if conditions are met. Pass now to evaluate a batch against a single clock reading."""
     if conditions is None:
         return True
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     if conditions.from_time:
         t = conditions.from_time
@@ -195,17 +196,27 @@ def load_local(category: str) -> list[Bulletin]:
         return []
 
 
-def fetch_remote_sync(category: str) -> list[Bulletin]:
-    """Fetch bulletins from GitHub synchronously."""
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Shared client so category fetches reuse one keep-alive connection to GitHub."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=3.0, limits=httpx.Limits(max_connections=2, max_keepalive_connections=1))
+    return _client
+
+
+def fetch_remote_sync(category: str) -> list[Bulletin] | None:
+    """Fetch bulletins from GitHub synchronously. Returns None if the fetch failed."""
     url = f"{REMOTE_BASE}/{category}.yml"
     try:
-        with httpx.Client(timeout=3.0) as client:
-            resp = client.get(url)
-            if resp.status_code == 200:
-                return load_from_yaml(resp.text)
+        resp = _get_client().get(url)
+        if resp.status_code == 200:
+            return load_from_yaml(resp.text)
     except Exception:
         pass
-    return []
+    return None
 
 
 class BulletinManager:
@@ -219,14 +230,14 @@ class BulletinManager:
     def _load_dismissed(self) -> None:
         if DISMISSED_FILE.exists():
             try:
-                data = oj.loads(DISMISSED_FILE.read_text())
+                data = oj.loads(DISMISSED_FILE.read_bytes())
                 self._dismissed = set(data.get("dismissed", []))
             except Exception:
                 pass
 
     def _save_dismissed(self) -> None:
         DISMISSED_FILE.parent.mkdir(parents=True, exist_ok=True)
-        DISMISSED_FILE.write_text(oj.dumps({"dismissed": list(self._dismissed)}))
+        DISMISSED_FILE.write_bytes(oj.dumpb({"dismissed": list(self._dismissed)}))
 
     def dismiss(self, bulletin_id: str, persist: bool = False) -> None:
         """Dismiss a bulletin."""
@@ -240,19 +251,27 @@ class BulletinManager:
     def get_active(self, category: str, include_dismissed: bool = False) -> list[Bulletin]:
         """Get bulletins that should be shown, sorted by priority."""
         bulletins = self._loaded.get(category, [])
+        now = datetime.now(timezone.utc)
         active = [
             b
             for b in bulletins
-            if (include_dismissed or not self.is_dismissed(b.id)) and evaluate_conditions(b.conditions)
+            if (include_dismissed or not self.is_dismissed(b.id)) and evaluate_conditions(b.conditions, now)
         ]
         return sorted(active, key=lambda b: b.priority, reverse=True)
 
     def load_sync(self, category: str) -> list[Bulletin]:
-        """Load bulletins synchronously. Dev mode overrides remote with local."""
+        """Load bulletins synchronously. Dev mode overrides remote with local.
+
+        Remote categories are fetched once per process; local files are re-read so edits show up immediately.
+        Failed fetches are not cached, so the next load retries.
+        """
         if is_dev_mode():
             self._loaded[category] = load_local(category)
-        else:
-            self._loaded[category] = fetch_remote_sync(category)
+        elif category not in self._loaded:
+            bulletins = fetch_remote_sync(category)
+            if bulletins is None:
+                return []
+            self._loaded[category] = bulletins
         return self._loaded[category]
 
 
@@ -36,8 +36,10 @@ class Checkpoint:
         files = {}
         for fpath in data.get("file_paths", []):
             backup_file = checkpoint_dir / data["id"] / Path(fpath).name
-            if backup_file.exists():
+            try:
                 files[fpath] = backup_file.read_bytes()
+            except FileNotFoundError:
+                continue
         return cls(
             id=data["id"],
             timestamp=data["timestamp"],
@@ -60,7 +62,7 @@ class CheckpointManager:
         index_file = CHECKPOINTS_DIR / "index.json"
         if index_file.exists():
             try:
-                data = oj.loads(index_file.read_text())
+                data = oj.loads(index_file.read_bytes())
                 self._checkpoints = [Checkpoint.from_dict(cp, CHECKPOINTS_DIR) for cp in data.get("checkpoints", [])]
                 self._counter = data.get("counter", 0)
             except Exception:
@@ -72,12 +74,12 @@ class CheckpointManager:
             "counter": self._counter,
             "checkpoints": [cp.to_dict() for cp in self._checkpoints],
         }
-        index_file.write_text(oj.dumps(data, indent=2))
+        index_file.write_bytes(oj.dumpb(data, indent=2))
 
     def create(self, paths: list[Path], description: str = "", session_id: str | None = None) -> Checkpoint | None:
         files = {}
         for path in paths:
-            if path.exists() and path.is_file():
+            if path.is_file():
                 try:
                     files[str(path)] = path.read_bytes()
                 except Exception:
@@ -8,7 +8,7 @@ from typing import Callable
 from .config import COMMANDS, COMMAND_OPTIONS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionResult:
     """Result of applying a completion to the input."""
 
@@ -16,7 +16,7 @@ class CompletionResult:
     cursor_position: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionRequest:
     """Request passed to dynamic completion providers."""
 
@@ -31,7 +31,7 @@ class CompletionRequest:
 CandidateProvider = Callable[[CompletionRequest], list[str] | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionContext:
     """Resolved completion context for the current cursor position."""
 
@@ -45,7 +45,7 @@ class CompletionContext:
     kind: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _TokenSpan:
     """Token with its span in the input string."""
 
@@ -175,7 +175,7 @@ def get_hint_candidates(
     return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CompletionContext:
     value: str
     command: str
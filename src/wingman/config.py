@@ -127,7 +127,7 @@ def load_api_key() -> str | None:
     """Load API key from config file."""
     if CONFIG_FILE.exists():
         try:
-            config = oj.loads(CONFIG_FILE.read_text())
+            config = oj.loads(CONFIG_FILE.read_bytes())
             return config.get("api_key")
         except Exception:
             pass
@@ -140,11 +140,11 @@ def save_api_key(api_key: str) -> None:
     config = {}
     if CONFIG_FILE.exists():
         try:
-            config = oj.loads(CONFIG_FILE.read_text())
+            config = oj.loads(CONFIG_FILE.read_bytes())
         except Exception:
             pass
     config["api_key"] = api_key
-    CONFIG_FILE.write_text(oj.dumps(config, indent=2))
+    CONFIG_FILE.write_bytes(oj.dumpb(config, indent=2))
 
 
 INSTRUCTION_FILENAMES = ["AGENTS.md", "WINGMAN.md"]
@@ -216,7 +216,9 @@ async def fetch_marketplace_servers() -> list[dict]:
         async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
             resp = await client.get(f"{DEDALUS_SITE_URL}/api/marketplace")
             if resp.status_code == 200:
-                data = resp.json()
+                data = oj.loads(resp.content)
+                if not isinstance(data, dict):
+                    return []
                 repos = data.get("repositories", [])
                 return [r for r in repos if r.get("tags", {}).get("use_cases", {}).get("featured", False)]
     except Exception:
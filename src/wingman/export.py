@@ -64,7 +64,11 @@ def import_session_from_file(path: Path) -> list[dict] | None:
     current_role = None
     current_content = []
     for line in content.split("\n"):
-        if line.startswith("## User"):
+        # Most lines are body text; one prefix check keeps them off the header comparisons
+        if not line.startswith("## "):
+            if current_role:
+                current_content.append(line)
+        elif line.startswith("## User"):
             if current_role and current_content:
                 messages.append({"role": current_role, "content": "\n".join(current_content).strip()})
             current_role = "user"
@@ -70,7 +70,7 @@ def is_image_path(text: str) -> Path | None:
     # Try each normalized candidate
     for candidate in _normalize_path(text):
         path = Path(candidate).expanduser()
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
 
         # macOS screenshots use narrow no-break space (\u202f) before AM/PM
@@ -79,7 +79,7 @@ def is_image_path(text: str) -> Path | None:
         fixed = re.sub(r"(\d)\s?(AM|PM)", "\\1\u202f\\2", candidate, flags=re.IGNORECASE)
         if fixed != candidate:
             path = Path(fixed).expanduser()
-            if path.exists() and path.is_file():
+            if path.is_file():
                 return path
 
     return None
@@ -11,6 +11,12 @@ def dumps(obj: object, *, indent: int | None = None) -> str:
     return orjson.dumps(obj, option=opts).decode("utf-8")
 
 
+def dumpb(obj: object, *, indent: int | None = None) -> bytes:
+    """Serialize to JSON bytes, for writing straight to disk without a decode/encode round-trip."""
+    opts = OPT_INDENT if indent else 0
+    return orjson.dumps(obj, option=opts)
+
+
 def loads(s: str | bytes) -> object:
     """Deserialize JSON string or bytes."""
     return orjson.loads(s)
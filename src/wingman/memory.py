@@ -2,7 +2,7 @@
 
 import time
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
 from .config import CONFIG_DIR
@@ -32,9 +32,8 @@ class ProjectMemory:
 
 
 def _get_memory_path() -> Path:
-    """Path for current directory's memory file."""
+    """Path for current directory's memory file. The directory is created on save, not here."""
     memory_dir = CONFIG_DIR / "memory"
-    memory_dir.mkdir(parents=True, exist_ok=True)
     cwd_hash = str(Path.cwd()).replace("/", "_").replace("\\", "_")
     return memory_dir / f"{cwd_hash}.json"
 
@@ -47,7 +46,7 @@ def _migrate_md_to_json(md_path: Path) -> ProjectMemory:
         return ProjectMemory(entries=[])
 
     # Split by double newlines, each becomes an entry
-    chunks = [c.strip() for c in content.split("\n\n") if c.strip()]
+    chunks = [c for c in (c.strip() for c in content.split("\n\n")) if c]
     entries = [MemoryEntry.create(c) for c in chunks]
     md_path.unlink()
     return ProjectMemory(entries=entries)
@@ -66,7 +65,7 @@ def load_memory() -> ProjectMemory:
 
     if json_path.exists():
         try:
-            data = oj.loads(json_path.read_text())
+            data = oj.loads(json_path.read_bytes())
             entries = [MemoryEntry(**e) for e in data.get("entries", [])]
             return ProjectMemory(entries=entries, version=data.get("version", 1))
         except Exception:
@@ -78,8 +77,10 @@ def load_memory() -> ProjectMemory:
 def save_memory(memory: ProjectMemory) -> None:
     """Save memory to disk."""
     path = _get_memory_path()
-    data = {"version": memory.version, "entries": [asdict(e) for e in memory.entries]}
-    path.write_text(oj.dumps(data, indent=2))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # orjson serializes dataclasses natively, no asdict() deep copy needed
+    data = {"version": memory.version, "entries": memory.entries}
+    path.write_bytes(oj.dumpb(data, indent=2))
 
 
 def add_entry(content: str) -> MemoryEntry:
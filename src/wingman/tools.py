@@ -5,9 +5,10 @@ import select
 import subprocess
 import threading
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from .checkpoints import get_checkpoint_manager, get_current_session
 
@@ -40,6 +41,10 @@ CONTENT_TRUNCATE_LIMIT = 8000
 DEFAULT_READ_LINES = 2000
 MAX_LINE_LENGTH = 2000
 
+# Command polling backs off while a process is silent and snaps back when it prints
+POLL_INTERVAL_MIN = 0.05
+POLL_INTERVAL_MAX = 0.4
+
 # App instance reference (set by app module, avoids circular import)
 _app_instance: Any = None
 
@@ -130,14 +135,27 @@ class BackgroundProcess:
         return self.process.poll() is None
 
 
+def _drain_ready_lines(stream: IO[str], lines: list[str], limit: int = 1000) -> int:
+    """Append lines that can be read without blocking, up to limit per call. Returns the number read."""
+    for count in range(limit):
+        ready, _, _ = select.select([stream], [], [], 0)
+        if not ready:
+            return count
+        line = stream.readline()
+        if not line:
+            return count
+        lines.append(line)
+    return limit
+
+
 # Background processes per panel
-_panel_background_processes: dict[str, dict[str, BackgroundProcess]] = {}
+_panel_background_processes: defaultdict[str, dict[str, BackgroundProcess]] = defaultdict(dict)
 _next_bg_id: int = 1
 _background_requested: dict[str, bool] = {}  # Per-panel background request flags
 _command_widget_counter: int = 0
 
 # Track segments (text + tool calls) per panel for session persistence
-_panel_segments: dict[str, list[dict]] = {}
+_panel_segments: defaultdict[str, list[dict]] = defaultdict(list)
 
 
 def _notify_mount(command: str, widget_id: str, panel_id: str | None = None) -> None:
@@ -180,12 +198,19 @@ def clear_segments(panel_id: str | None = None) -> None:
         _panel_segments[panel_id] = []
 
 
+def release_panel(panel_id: str) -> None:
+    """Drop per-panel tracking state once a panel is closed.
+
+    Background processes are kept so they still surface completion notices.
+    """
+    _panel_segments.pop(panel_id, None)
+    _background_requested.pop(panel_id, None)
+
+
 def add_text_segment(text: str, panel_id: str | None = None) -> None:
     """Add or append to text segment for a panel."""
     if not panel_id:
         return
-    if panel_id not in _panel_segments:
-        _panel_segments[panel_id] = []
     segments = _panel_segments[panel_id]
     if segments and segments[-1].get("type") == "text":
         segments[-1]["content"] += text
@@ -197,8 +222,6 @@ def _track_tool_call(command: str, output: str, status: str, panel_id: str | Non
     """Track a tool call for session persistence."""
     if not panel_id:
         return
-    if panel_id not in _panel_segments:
-        _panel_segments[panel_id] = []
     _panel_segments[panel_id].append(
         {
             "type": "tool",
@@ -228,9 +251,12 @@ def check_completed_processes() -> list[tuple[str, str, int, str]]:
     Returns list of (panel_id, bg_id, exit_code, command) for newly completed processes.
     """
     completed = []
+    if not _panel_background_processes:
+        return completed
     for panel_id, processes in _panel_background_processes.items():
         for bg_id, proc in processes.items():
-            if not proc.is_running() and not proc.notified:
+            # Check the flag first: already-reported processes don't need another poll() syscall
+            if not proc.notified and not proc.is_running():
                 proc.notified = True
                 proc.read_output()  # Capture final output
                 exit_code = proc.process.returncode or 0
@@ -644,11 +670,13 @@ async def _run_command_impl(command: str, working_dir: Path, panel_id: str | Non
         )
 
         output_lines = []
-        start_time = time.time()
         timeout = 120
+        deadline = time.monotonic() + timeout
+
+        poll_delay = POLL_INTERVAL_MIN
 
         while True:
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(poll_delay)
 
             if panel_id and _background_requested.get(panel_id, False):
                 _background_requested[panel_id] = False
@@ -662,8 +690,6 @@ async def _run_command_impl(command: str, working_dir: Path, panel_id: str | Non
                     output_buffer=output_lines.copy(),
                 )
                 # Store in per-panel dict
-                if panel_id not in _panel_background_processes:
-                    _panel_background_processes[panel_id] = {}
                 _panel_background_processes[panel_id][bg_id] = bg_proc
 
                 await _update_command_status(widget_id, "backgrounded", panel_id=panel_id)
@@ -676,14 +702,12 @@ async def _run_command_impl(command: str, working_dir: Path, panel_id: str | Non
                     output_lines.append(remaining)
                 break
 
-            if proc.stdout:
-                ready, _, _ = select.select([proc.stdout], [], [], 0)
-                if ready:
-                    line = proc.stdout.readline()
-                    if line:
-                        output_lines.append(line)
+            if proc.stdout and _drain_ready_lines(proc.stdout, output_lines):
+                poll_delay = POLL_INTERVAL_MIN
+            else:
+                poll_delay = min(poll_delay * 2, POLL_INTERVAL_MAX)
 
-            if time.time() - start_time > timeout:
+            if time.monotonic() > deadline:
                 proc.terminate()
                 output = "".join(output_lines[-50:])
                 await _update_command_status(widget_id, "error", f"Timed out after {timeout}s", panel_id)
@@ -896,10 +920,12 @@ async def _run_command_impl_headless(command: str, working_dir: Path, timeout: i
         )
 
         output_lines = []
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+
+        poll_delay = POLL_INTERVAL_MIN
 
         while True:
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(poll_delay)
 
             if proc.poll() is not None:
                 remaining = proc.stdout.read() if proc.stdout else ""
@@ -907,14 +933,12 @@ async def _run_command_impl_headless(command: str, working_dir: Path, timeout: i
                     output_lines.append(remaining)
                 break
 
-            if proc.stdout:
-                ready, _, _ = select.select([proc.stdout], [], [], 0)
-                if ready:
-                    line = proc.stdout.readline()
-                    if line:
-                        output_lines.append(line)
+            if proc.stdout and _drain_ready_lines(proc.stdout, output_lines):
+                poll_delay = POLL_INTERVAL_MIN
+            else:
+                poll_delay = min(poll_delay * 2, POLL_INTERVAL_MAX)
 
-            if time.time() - start_time > timeout:
+            if time.monotonic() > deadline:
                 proc.terminate()
                 output = "".join(output_lines[-50:])
                 return f"Error: Command timed out after {timeout}s\n" + output
@@ -1,5 +1,7 @@
 """UI widgets for chat interface."""
 
+import asyncio
+import contextlib
 import random
 import time
 from dataclasses import dataclass
@@ -12,6 +14,7 @@ from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.css.query import NoMatches
 from textual.message import Message
 from textual.widgets import Input, Static
 
@@ -260,7 +263,7 @@ class ChatMessage(Static):
 class Thinking(Static):
     """Loading indicator with dynamic status label."""
 
-    FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
     IDLE_LABELS = ["Mazing", "Soaring", "Ascending Olympus", "Weaving fate", "Consulting the Oracle"]
 
     def __init__(self, **kwargs):
@@ -282,10 +285,11 @@ class Thinking(Static):
         self.refresh()
 
     def render(self) -> Text:
-        spinner = f"[#e0af68]{self.FRAMES[self._frame]}[/]"
+        # Runs every tick; assemble styled spans directly instead of parsing markup
+        spinner = (self.FRAMES[self._frame], "#e0af68")
         if self._status:
-            return Text.from_markup(f"{spinner} [#a9b1d6]{escape(self._status)}[/]")
-        return Text.from_markup(f"{spinner} [dim #a9b1d6]{self._idle_label}...[/]")
+            return Text.assemble(spinner, " ", (self._status, "#a9b1d6"))
+        return Text.assemble(spinner, " ", (f"{self._idle_label}...", "dim #a9b1d6"))
 
 
 class StreamingText(Static):
@@ -294,16 +298,31 @@ class StreamingText(Static):
     def __init__(self, **kwargs):
         super().__init__("", **kwargs)
         self._content = ""
+        self._update_pending = False
 
     def append_text(self, text: str) -> None:
-        """Append text to the streaming content."""
+        """Append text to the streaming content.
+
+        Chunks arriving between refreshes are coalesced into a single update, which also keeps
+        the enclosing scroll view pinned to the end.
+        """
         self._content += text
-        self.update(Text.from_markup(f"[#c0caf5]{escape(self._content)}[/]"))
+        if not self._update_pending:
+            self._update_pending = True
+            self.call_after_refresh(self._flush)
+
+    def _flush(self) -> None:
+        self._update_pending = False
+        # Plain styled Text: no escape/markup re-parse of the whole buffer on every chunk
+        self.update(Text(self._content, style="#c0caf5"))
+        # Scroll after the update so the next refresh measures the flushed text
+        with contextlib.suppress(NoMatches):
+            self.query_ancestor(VerticalScroll).scroll_end(animate=False)
 
     def mark_complete(self) -> None:
         """Ensure final content is displayed, stripped of trailing whitespace."""
         self._content = self._content.rstrip()
-        self.update(Text.from_markup(f"[#c0caf5]{escape(self._content)}[/]"))
+        self.update(Text(self._content, style="#c0caf5"))
 
 
 class ToolApproval(Vertical, can_focus=True):
@@ -319,13 +338,35 @@ class ToolApproval(Vertical, can_focus=True):
         Binding("enter", "confirm", "Confirm", show=False),
     ]
 
+    OPTIONS = (
+        ("y.", "Yes", "#9ece6a"),
+        ("a.", "Yes, always allow this session", "#9ece6a"),
+        ("n.", "No, and tell me what to do differently", "#f7768e"),
+    )
+
     def __init__(self, tool_name: str, command: str, **kwargs):
         super().__init__(**kwargs)
         self.tool_name = tool_name
         self.command = command
-        self.result: tuple[str, str] | None = None  # ("yes"/"always"/"no", feedback)
+        self._result: tuple[str, str] | None = None  # ("yes"/"always"/"no", feedback)
+        self.decided = asyncio.Event()  # Set once result is chosen, so waiters don't have to poll
         self._selected = 0  # 0=yes, 1=always, 2=no
         self._feedback_mode = False
+        # Tool name and command never change, so escape them once
+        self._header = (
+            f"[bold #e0af68]{escape(tool_name)}[/]",
+            f"  [dim]{escape(command)}[/]",
+        )
+
+    @property
+    def result(self) -> tuple[str, str] | None:
+        return self._result
+
+    @result.setter
+    def result(self, value: tuple[str, str] | None) -> None:
+        self._result = value
+        if value is not None:
+            self.decided.set()
 
     def compose(self) -> ComposeResult:
         yield Static(id="approval-content")
@@ -343,26 +384,16 @@ class ToolApproval(Vertical, can_focus=True):
         feedback_input = self.query_one("#approval-feedback", Input)
 
         if self._feedback_mode:
-            lines = [
-                f"[bold #e0af68]{escape(self.tool_name)}[/]",
-                f"  [dim]{escape(self.command)}[/]",
-            ]
-            content.update(Text.from_markup("\n".join(lines)))
+            content.update(Text.from_markup("\n".join(self._header)))
             input_row.remove_class("hidden")
             feedback_input.focus()
         else:
-            options = [
-                ("y.", "Yes", "#9ece6a"),
-                ("a.", "Yes, always allow this session", "#9ece6a"),
-                ("n.", "No, and tell me what to do differently", "#f7768e"),
-            ]
             lines = [
-                f"[bold #e0af68]{escape(self.tool_name)}[/]",
-                f"  [dim]{escape(self.command)}[/]",
+                *self._header,
                 "",
                 "[#a9b1d6]Do you want to proceed?[/]",
             ]
-            for i, (key, label, color) in enumerate(options):
+            for i, (key, label, color) in enumerate(self.OPTIONS):
                 if i == self._selected:
                     lines.append(f"[{color}]› {key}[/] [bold]{label}[/]")
                 else:
@@ -468,12 +499,21 @@ class CommandStatus(Static):
     MAX_OUTPUT_LINES = 3
     MAX_LINE_LENGTH = 80
 
+    # (dot, hint) per finished status; running commands cycle through PULSE_DOTS
+    STATUS_MARKERS = {
+        "success": ("[#9ece6a]•[/]", ""),
+        "error": ("[#f7768e]•[/]", ""),
+        "backgrounded": ("[#e0af68]•[/]", "  [dim]backgrounded[/]"),
+    }
+    PULSE_DOTS = tuple(f"[{c}]•[/]" for c in ("#3d59a1", "#5a7ac7", "#7aa2f7", "#9fc5ff", "#7aa2f7", "#5a7ac7"))
+    PULSE_HINT = "  [dim]Ctrl+B to background[/]"
+
     def __init__(self, command: str, status: str | None = None, output: str | None = None, **kwargs):
         super().__init__(**kwargs)
         self.command = command
         self._pulse = 0
         self._status: str | None = status
-        self._output: str | None = output
+        self._preview = self._build_preview(output)
         self._timer = None
 
     def on_mount(self) -> None:
@@ -482,12 +522,12 @@ class CommandStatus(Static):
             self._timer = self.set_interval(0.15, self._tick)
 
     def _tick(self) -> None:
-        self._pulse = (self._pulse + 1) % 6
+        self._pulse = (self._pulse + 1) % len(self.PULSE_DOTS)
         self.refresh()
 
     def set_status(self, status: str, output: str | None = None) -> None:
         self._status = status
-        self._output = output
+        self._preview = self._build_preview(output)
         # Stop the pulsing timer
         if self._timer:
             self._timer.stop()
@@ -495,37 +535,36 @@ class CommandStatus(Static):
         self.refresh()
 
     def render(self) -> Text:
-        if self._status == "success":
-            dot = "[#9ece6a]•[/]"
-            hint = ""
-        elif self._status == "error":
-            dot = "[#f7768e]•[/]"
-            hint = ""
-        elif self._status == "backgrounded":
-            dot = "[#e0af68]•[/]"
-            hint = "  [dim]backgrounded[/]"
+        marker = self.STATUS_MARKERS.get(self._status)
+        if marker:
+            dot, hint = marker
         else:
-            colors = ["#3d59a1", "#5a7ac7", "#7aa2f7", "#9fc5ff", "#7aa2f7", "#5a7ac7"]
-            dot = f"[{colors[self._pulse]}]•[/]"
-            hint = "  [dim]Ctrl+B to background[/]"
+            dot, hint = self.PULSE_DOTS[self._pulse], self.PULSE_HINT
 
         result = f"{dot} [dim]$ {escape(self.command)}[/]{hint}"
 
         # Add output preview if available
-        if self._output and self._status in ("success", "error"):
-            lines = [l for l in self._output.strip().split("\n") if l.strip()]
-            if lines:
-                preview_lines = []
-                for line in lines[: self.MAX_OUTPUT_LINES]:
-                    if len(line) > self.MAX_LINE_LENGTH:
-                        line = line[: self.MAX_LINE_LENGTH - 3] + "..."
-                    preview_lines.append(f"  [dim #7dcfff]→[/] [#a9b1d6]{escape(line)}[/]")
-                if len(lines) > self.MAX_OUTPUT_LINES:
-                    preview_lines.append(f"  [dim]... +{len(lines) - self.MAX_OUTPUT_LINES} more lines[/]")
-                result += "\n" + "\n".join(preview_lines)
+        if self._preview and self._status in ("success", "error"):
+            result += "\n" + self._preview
 
         return Text.from_markup(result)
 
+    def _build_preview(self, output: str | None) -> str:
+        """Format the output preview once, rather than re-splitting output on every render."""
+        if not output:
+            return ""
+        lines = [l for l in output.strip().split("\n") if l.strip()]
+        if not lines:
+            return ""
+        preview_lines = []
+        for line in lines[: self.MAX_OUTPUT_LINES]:
+            if len(line) > self.MAX_LINE_LENGTH:
+                line = line[: self.MAX_LINE_LENGTH - 3] + "..."
+            preview_lines.append(f"  [dim #7dcfff]→[/] [#a9b1d6]{escape(line)}[/]")
+        if len(lines) > self.MAX_OUTPUT_LINES:
+            preview_lines.append(f"  [dim]... +{len(lines) - self.MAX_OUTPUT_LINES} more lines[/]")
+        return "\n".join(preview_lines)
+
 
 _panel_counter: int = 0
 
@@ -551,6 +590,7 @@ class ChatPanel(Vertical):
         self._is_active = False
         self._generating = False
         self._cancel_requested = False
+        self._worker_active = False  # Unlike _generating, stays set until the send worker has saved its reply
         self.working_dir: Path = Path.cwd()
 
     @property
@@ -686,6 +726,8 @@ class ChatPanel(Vertical):
         chat.remove_children()
         base_id = int(time.time() * 1000)
         widget_id = 0
+        # Collect everything first so the history is mounted in one batch
+        widgets: list[Static] = []
         for msg in self.messages:
             if msg["role"] not in ("user", "assistant"):
                 continue
@@ -701,14 +743,14 @@ class ChatPanel(Vertical):
                             output=seg.get("output"),
                             id=f"loaded-{base_id}-{widget_id}",
                         )
-                        chat.mount(widget)
+                        widgets.append(widget)
                     elif seg.get("type") == "text":
                         content = seg.get("content", "")
                         if content:
                             # Match StreamingText color and spacing
-                            chat.mount(
+                            widgets.append(
                                 Static(
-                                    Text.from_markup(f"[#c0caf5]{escape(content)}[/]"),
+                                    Text(content, style="#c0caf5"),
                                     id=f"loaded-{base_id}-{widget_id}",
                                     classes="loaded-text",
                                 )
@@ -726,7 +768,7 @@ class ChatPanel(Vertical):
                         output=tc.get("output"),
                         id=f"loaded-{base_id}-{widget_id}",
                     )
-                    chat.mount(widget)
+                    widgets.append(widget)
 
             content = msg.get("content")
             if not content:
@@ -737,9 +779,10 @@ class ChatPanel(Vertical):
                 display_text = " ".join(text_parts) or "(image)"
                 if img_count:
                     display_text += f" [#7dcfff][{img_count} image{'s' if img_count != 1 else ''}][/]"
-                chat.mount(ChatMessage(msg["role"], display_text))
+                widgets.append(ChatMessage(msg["role"], display_text))
             else:
-                chat.mount(ChatMessage(msg["role"], content))
+                widgets.append(ChatMessage(msg["role"], content))
+        chat.mount_all(widgets)
         self.get_scroll_container().scroll_end(animate=False)
 
     def action_focus_input(self) -> None:
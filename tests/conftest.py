@@ -6,7 +6,7 @@ import pytest
 pytest_plugins = ["pytest_asyncio"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def banner_yaml():
     """Sample banner YAML content."""
     return """
@@ -20,7 +20,7 @@ messages:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tip_yaml():
     """Sample tip YAML content."""
     return """
@@ -35,7 +35,7 @@ messages:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def conditional_yaml():
     """YAML with time-based conditions."""
     return """
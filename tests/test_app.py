@@ -1,8 +1,23 @@
 """Tests for WingmanApp UI interactions"""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    """Redirect session storage to temp directory."""
+    monkeypatch.setattr("wingman.sessions.SESSIONS_DIR", tmp_path)
+    return tmp_path
+
+
+def _chunk(text: str) -> SimpleNamespace:
+    """Build a raw streaming chunk carrying a text delta."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text, tool_calls=None))])
+
+
 class TestPanelManagement:
     """Test panel split, close, and focus."""
 
@@ -56,6 +71,49 @@ class TestPanelManagement:
             await pilot.pause()
             assert len(app.panels) == 1
 
+    @pytest.mark.asyncio
+    async def test_close_panel_mid_generation(self, sessions_dir):
+        """Closing a generating panel cancels it and still saves the reply so far."""
+        from wingman.app import WingmanApp
+        from wingman.sessions import get_session
+        from wingman.tools import _panel_segments
+        from wingman.ui import Thinking
+
+        proceed = asyncio.Event()
+
+        async def stream():
+            yield _chunk("Hello ")
+            await proceed.wait()
+            yield _chunk("world")
+
+        app = WingmanApp()
+        async with app.run_test() as pilot:
+            app.action_split_panel()
+            await pilot.pause()
+            app.coding_mode = False
+            app.runner = SimpleNamespace(run=lambda **kwargs: stream())
+            panel = app.active_panel
+            panel.session_id = "chat-close-test"
+            panel.add_message("user", "hi")
+            thinking = Thinking(id="thinking")
+            panel.get_chat_container().mount(thinking)
+            await pilot.pause()
+
+            app._send_message(panel, "hi", thinking)
+            while not panel._generating:
+                await pilot.pause()
+
+            app.action_close_panel()
+            assert panel._cancel_requested
+            proceed.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            messages = get_session("chat-close-test")
+            assert messages[-1]["role"] == "assistant"
+            assert messages[-1]["segments"] == [{"type": "text", "content": "Hello "}]
+            assert panel.panel_id not in _panel_segments
+
 
 class TestPanelNavigation:
     """Test panel focus and navigation."""
@@ -65,6 +65,12 @@ class TestConditions:
         )
         assert evaluate_conditions(cond) is True
 
+    def test_explicit_now(self):
+        """Caller-supplied time is used instead of the current clock."""
+        cond = Conditions(until=datetime(2020, 1, 1, tzinfo=timezone.utc))
+        assert evaluate_conditions(cond, now=datetime(2019, 6, 1, tzinfo=timezone.utc)) is True
+        assert evaluate_conditions(cond, now=datetime(2021, 6, 1, tzinfo=timezone.utc)) is False
+
     def test_platform_match(self):
         """Platform condition matching."""
         import sys
@@ -132,6 +138,31 @@ class TestBulletinManager:
         active = mgr.get_active("test")
         assert [b.id for b in active] == ["high", "mid", "low"]
 
+    def test_remote_fetched_once(self, monkeypatch, banner_yaml):
+        """Remote categories are cached after the first successful load; failures are retried."""
+        import wingman.bulletin as bulletin
+
+        calls = []
+
+        def fake_fetch(category):
+            calls.append(category)
+            # First fetch fails (e.g. offline at startup)
+            if len(calls) == 1:
+                return None
+            return load_from_yaml(banner_yaml)
+
+        monkeypatch.delenv("WINGMAN_BULLETIN_PATH", raising=False)
+        monkeypatch.delenv("WINGMAN_DEV", raising=False)
+        monkeypatch.setattr(bulletin, "fetch_remote_sync", fake_fetch)
+
+        mgr = BulletinManager()
+        assert mgr.load_sync("banners") == []
+        assert mgr.get_active("banners") == []
+        mgr.load_sync("banners")
+        mgr.load_sync("banners")
+        assert calls == ["banners", "banners"]
+        assert len(mgr.get_active("banners")) == 1
+
 
 class TestDevMode:
     """Test dev mode detection."""
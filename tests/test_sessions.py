@@ -0,0 +1,43 @@
+"""Tests for session storage."""
+
+import threading
+
+import pytest
+
+from wingman.sessions import get_session, load_sessions, save_session
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    """Redirect session storage to temp directory."""
+    monkeypatch.setattr("wingman.sessions.SESSIONS_DIR", tmp_path)
+    return tmp_path
+
+
+class TestSessionStorage:
+    """Test session persistence."""
+
+    def test_save_and_get(self, sessions_dir):
+        """Saved messages round-trip through get_session."""
+        save_session("s1", [{"role": "user", "content": "hi"}])
+        assert get_session("s1") == [{"role": "user", "content": "hi"}]
+
+    def test_concurrent_save_and_load(self, sessions_dir):
+        """Loads during a background save never see a partial file."""
+        messages = [{"role": "user", "content": "x" * 1000}] * 50
+        save_session("s1", messages)
+        stop = threading.Event()
+
+        def writer():
+            while not stop.is_set():
+                save_session("s1", messages)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(500):
+                assert "s1" in load_sessions()
+        finally:
+            stop.set()
+            thread.join()
+        assert not list(sessions_dir.glob("*.tmp"))